@@ -2,11 +2,10 @@
 Minimal example game using PyTermGame.
 
 This shows the simplest possible game using the engine.
-"""
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+Run with (after `pip install -e .`):
+    python examples/minimal_game.py
+"""
 
 from pytermgame.engine import Game
 from pytermgame.input import Keys
@@ -16,6 +15,8 @@ from pytermgame.utils import Color
 class MinimalGame(Game):
     """A minimal game example - move a character around the screen."""
     
+    __slots__ = ('player_x', 'player_y')
+    
     def __init__(self):
         super().__init__(width=40, height=15, fps=15, title="Minimal Example")
         
@@ -5,27 +5,29 @@ Supports both curses (if available) and ANSI fallback mode.
 """
 
 import time
+import selectors
 import sys
 import os
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List, Iterable
 from abc import ABC, abstractmethod
 
 from .screen import Screen
-from .input import InputHandler, Keys
+from .input import ANSIKeyDecoder, InputHandler, Keys
+from .utils import optional_import
 
-# Try to import curses
-try:
-    import curses
-    CURSES_AVAILABLE = True
-except ImportError:
-    CURSES_AVAILABLE = False
+# Optional platform modules are only imported once a game runs
+_PLATFORM_FLAGS = {
+    "CURSES_AVAILABLE": "curses",
+    "MSVCRT_AVAILABLE": "msvcrt",      # Windows keyboard input fallback
+    "TERMIOS_AVAILABLE": "termios",    # POSIX raw keyboard input for ANSI mode
+}
 
-# Windows keyboard input fallback
-try:
-    import msvcrt
-    MSVCRT_AVAILABLE = True
-except ImportError:
-    MSVCRT_AVAILABLE = False
+
+def __getattr__(name):
+    """Lazily probe the *_AVAILABLE platform flags."""
+    if name in _PLATFORM_FLAGS:
+        return optional_import(_PLATFORM_FLAGS[name]) is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Game(ABC):
@@ -50,12 +52,26 @@ class Game(ABC):
             MyGame(width=80, height=24).run()
     """
     
+    # Engine state lives in slots for fast attribute access in the loop.
+    # Subclasses without __slots__ still get a __dict__ for their own fields.
+    __slots__ = (
+        'width', 'height', 'target_fps', 'title', 'screen', 'input', 'state',
+        '_running', '_current_key', '_pending_keys', '_keys_this_frame',
+        '_early_keys', '_stdin_fd', '_ansi_decoder', '_msvcrt', '_frame_count',
+        '_start_time', '_dt',
+    )
+    
+    # Start every draw() from an empty screen buffer. Games that only redraw
+    # what changed can set this to False; the buffer then keeps last frame.
+    auto_clear = True
+    
     def __init__(
         self,
         width: int = 80,
         height: int = 24,
         fps: int = 15,
-        title: str = "PyTermGame"
+        title: str = "PyTermGame",
+        async_output: bool = False
     ):
         """
         Initialize the game engine.
@@ -65,17 +81,28 @@ class Game(ABC):
             height: Screen height in characters
             fps: Target frames per second (lower = slower)
             title: Game window title (for future use)
+            async_output: In ANSI mode, write frames from a background
+                thread (helps over SSH or other slow terminals)
         """
         self.width = width
         self.height = height
         self.target_fps = fps
         self.title = title
         
-        self.screen = Screen(width, height)
+        self.screen = Screen(width, height, async_output=async_output)
         self.input = InputHandler(use_wasd=True)
         
         self._running = False
         self._current_key: Optional[int] = None
+        self._pending_keys: List[int] = []
+        # Same keys as a set for O(1) is_key_pressed checks
+        self._keys_this_frame: frozenset = frozenset()
+        # Keys read while waiting for the next frame
+        self._early_keys: List[int] = []
+        self._stdin_fd: Optional[int] = None
+        # Holds escape sequences split across stdin reads
+        self._ansi_decoder = ANSIKeyDecoder()
+        self._msvcrt = None
         self._frame_count = 0
         self._start_time = 0.0
         self._dt = 0.0
@@ -89,7 +116,9 @@ class Game(ABC):
         
         Uses curses if available, otherwise falls back to ANSI mode.
         """
-        if CURSES_AVAILABLE:
+        curses = optional_import('curses')
+        self._msvcrt = optional_import('msvcrt')
+        if curses is not None:
             curses.wrapper(self._main_loop_curses)
         else:
             self._main_loop_ansi()
@@ -102,87 +131,214 @@ class Game(ABC):
     
     def _main_loop_ansi(self):
         """Main game loop using ANSI escape codes (fallback)"""
-        # Hide cursor and clear screen
-        sys.stdout.write("\033[?25l")  # Hide cursor
-        sys.stdout.write("\033[2J")    # Clear screen
-        sys.stdout.flush()
+        # Hide cursor and clear screen (sent together with the first frame)
+        self.screen.write("\033[?25l")  # Hide cursor
+        self.screen.write("\033[2J")    # Clear screen
+        saved_mode = self._enter_cbreak()
         
         try:
             self._run_loop()
         finally:
+            self._restore_terminal(saved_mode)
+            # Frames only repaint changed cells, so the cursor may be mid-board;
+            # park it below the frame so the shell prompt does not overwrite it
+            self.screen.write(f"\033[{self.screen.height};1H\n")
             # Show cursor again
-            sys.stdout.write("\033[?25h")
-            sys.stdout.flush()
+            self.screen.write("\033[?25h")
+            self.screen.close()
+    
+    def _enter_cbreak(self):
+        """
+        Switch stdin to unbuffered, non-blocking, no-echo mode (POSIX only).
+        
+        Returns:
+            The previous terminal attributes, or None if unchanged
+        """
+        termios = optional_import('termios')
+        if termios is None or not sys.stdin.isatty():
+            return None
+        fd = sys.stdin.fileno()
+        saved_mode = termios.tcgetattr(fd)
+        mode = termios.tcgetattr(fd)
+        mode[3] &= ~(termios.ICANON | termios.ECHO)  # lflags
+        # Reads return immediately with whatever is available
+        mode[6][termios.VMIN] = 0
+        mode[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        self._stdin_fd = fd
+        self._ansi_decoder.reset()
+        return saved_mode
+    
+    def _restore_terminal(self, saved_mode):
+        """Undo _enter_cbreak"""
+        if saved_mode is not None and self._stdin_fd is not None:
+            termios = optional_import('termios')
+            termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, saved_mode)
+        self._stdin_fd = None
     
     def _run_loop(self):
         """Common game loop logic"""
         self._running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         
         # Call user setup
         self.setup()
         
-        frame_time = 1.0 / self.target_fps
-        last_time = time.time()
+        # Frames are paced against a fixed deadline on the monotonic clock so
+        # sleep overshoot does not accumulate into drift
+        last_ns = time.monotonic_ns()
+        next_deadline = last_ns
+        
+        selector = self._input_selector()
+        try:
+            while self._running:
+                current_ns = time.monotonic_ns()
+                self._dt = (current_ns - last_ns) / 1e9
+                last_ns = current_ns
+                
+                # Process every key that arrived since the last frame
+                self._set_keys(self._get_input())
+                
+                # Check for quit
+                if Keys.Q in self._keys_this_frame or Keys.ESCAPE in self._keys_this_frame:
+                    if self.on_quit():
+                        break
+                
+                # Update game state
+                self.update(self._dt)
+                
+                # Draw
+                self.draw()
+                
+                # Refresh screen (and clear the buffer for the next frame)
+                self.screen.refresh(clear=self.auto_clear)
+                
+                # Update input state
+                self._clear_keys()
+                
+                # Frame timing (re-read target_fps so games can change speed)
+                next_deadline += 1_000_000_000 // self.target_fps
+                if next_deadline > time.monotonic_ns():
+                    self._wait_for_frame(next_deadline, selector)
+                else:
+                    # Running behind: start over instead of rushing to catch up
+                    next_deadline = time.monotonic_ns()
+                
+                self._frame_count += 1
+        finally:
+            if selector is not None:
+                selector.close()
+    
+    def _input_selector(self) -> Optional[selectors.BaseSelector]:
+        """Selector that wakes up on keyboard input, if stdin supports it"""
+        if self._stdin_fd is not None:
+            fd = self._stdin_fd
+        elif self.screen._curses_mode and sys.platform != 'win32' and sys.stdin.isatty():
+            # curses reads the same terminal, so its fd signals key presses
+            fd = sys.stdin.fileno()
+        else:
+            return None
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        return selector
+    
+    def _wait_for_frame(self, deadline: int, selector):
+        """
+        Wait until the next frame is due.
+        
+        Keys that arrive meanwhile are read straight away and passed to
+        on_input(), then kept for the next frame's update().
+        """
+        while True:
+            remaining = deadline - time.monotonic_ns()
+            if remaining <= 0:
+                return
+            if selector is None:
+                time.sleep(remaining / 1e9)
+                return
+            if not selector.select(remaining / 1e9):
+                # Deadline reached with no input
+                return
+            keys = [self.input.process_key(key) for key in self._get_input()]
+            if not keys:
+                # Only part of an escape sequence (kept by the decoder until
+                # the rest arrives) or an ignored one; nothing to report
+                time.sleep(max(0, deadline - time.monotonic_ns()) / 1e9)
+                return
+            self._early_keys.extend(keys)
+            self.on_input(keys)
+    
+    def step(self, keys: Iterable[int] = ()):
+        """
+        Advance the game by one frame without drawing or waiting.
+        
+        For headless runs such as tests, bots or AI training rollouts.
+        Call setup() once before the first step.
+        
+        Args:
+            keys: Key codes pressed during this frame
+        """
+        self._set_keys(keys)
+        self._dt = 1.0 / self.target_fps
+        self.update(self._dt)
+        self._clear_keys()
+        self._frame_count += 1
+    
+    def _set_keys(self, raw_keys: Iterable[int]):
+        """Set the keys pressed this frame"""
+        self._pending_keys = self._early_keys + [self.input.process_key(key) for key in raw_keys]
+        self._early_keys = []
+        self._keys_this_frame = frozenset(self._pending_keys)
+        self._current_key = self._pending_keys[-1] if self._pending_keys else None
+    
+    def _clear_keys(self):
+        """Reset per-frame input state"""
+        self.input.update()
+        self._current_key = None
+        self._pending_keys = []
+        self._keys_this_frame = frozenset()
+    
+    def _get_input(self) -> List[int]:
+        """Get all pending keyboard input based on available backend"""
+        keys = []
         
-        while self._running:
-            current_time = time.time()
-            self._dt = current_time - last_time
-            
-            # Process input
-            raw_key = self._get_input()
-            self._current_key = self.input.process_key(raw_key)
-            
-            # Check for quit
-            if self._current_key == Keys.Q or self._current_key == Keys.ESCAPE:
-                if self.on_quit():
-                    break
-            
-            # Update game state
-            self.update(self._dt)
-            
-            # Clear and draw
-            self.screen.clear()
-            self.draw()
-            
-            # Refresh screen
-            self.screen.refresh()
-            
-            # Update input state
-            self.input.update()
-            self._current_key = None
-            
-            # Frame timing
-            elapsed = time.time() - current_time
-            if elapsed < frame_time:
-                time.sleep(frame_time - elapsed)
-            
-            last_time = current_time
-            self._frame_count += 1
-    
-    def _get_input(self) -> Optional[int]:
-        """Get keyboard input based on available backend"""
         # Try curses first
         key = self.screen.get_input()
-        if key is not None:
-            return key
+        while key is not None:
+            keys.append(key)
+            key = self.screen.get_input()
+        if keys:
+            return keys
         
         # Fall back to msvcrt on Windows
-        if MSVCRT_AVAILABLE and msvcrt.kbhit():
-            ch = msvcrt.getch()
-            # Handle arrow keys (they send 2 bytes)
-            if ch in (b'\x00', b'\xe0'):
-                ch2 = msvcrt.getch()
-                arrow_map = {
-                    b'H': Keys.UP,
-                    b'P': Keys.DOWN,
-                    b'K': Keys.LEFT,
-                    b'M': Keys.RIGHT,
-                }
-                return arrow_map.get(ch2)
-            return ord(ch)
+        msvcrt = self._msvcrt
+        if msvcrt is not None:
+            while msvcrt.kbhit():
+                ch = msvcrt.getch()
+                # Handle arrow keys (they send 2 bytes)
+                if ch in (b'\x00', b'\xe0'):
+                    ch2 = msvcrt.getch()
+                    arrow_map = {
+                        b'H': Keys.UP,
+                        b'P': Keys.DOWN,
+                        b'K': Keys.LEFT,
+                        b'M': Keys.RIGHT,
+                    }
+                    if ch2 in arrow_map:
+                        keys.append(arrow_map[ch2])
+                else:
+                    keys.append(ord(ch))
+            return keys
+        
+        # Raw stdin on POSIX terminals (non-blocking after _enter_cbreak)
+        if self._stdin_fd is not None:
+            try:
+                data = os.read(self._stdin_fd, 1024)
+            except OSError:
+                data = b''
+            keys.extend(self._ansi_decoder.feed(data))
         
-        return None
+        return keys
     
     def quit(self):
         """Exit the game loop"""
@@ -199,14 +355,30 @@ class Game(ABC):
         """
         return True
     
+    def on_input(self, keys: List[int]):
+        """
+        Called as soon as keys arrive while waiting for the next frame.
+        
+        The keys are also delivered to the next update() as usual. Override
+        to react before the next tick (e.g. queue a direction change).
+        
+        Args:
+            keys: Key codes that just arrived
+        """
+        pass
+    
     def is_key_pressed(self, key: int) -> bool:
         """Check if a specific key was pressed this frame"""
-        return self._current_key == key
+        return key in self._keys_this_frame
     
     def get_key(self) -> Optional[int]:
         """Get the current key press (or None)"""
         return self._current_key
     
+    def get_keys(self) -> List[int]:
+        """Get every key pressed this frame, oldest first"""
+        return self._pending_keys
+    
     @property
     def frame_count(self) -> int:
         """Get current frame number"""
@@ -215,7 +387,7 @@ class Game(ABC):
     @property
     def elapsed_time(self) -> float:
         """Get elapsed time since game start"""
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
     
     @property
     def delta_time(self) -> float:
@@ -2,12 +2,31 @@
 Entities module - Game objects and sprites
 """
 
-from typing import Optional, List
+import re
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
-class Sprite:
+# A run of opaque (non-space) characters within a sprite line
+_OPAQUE_RUN = re.compile(r'[^ ]+')
+
+# Drawn for entities without a sprite
+POINT_CHAR = '█'
+
+
+class _Weakrefable:
+    """
+    Base that adds the __weakref__ slot to slotted dataclasses.
+    
+    dataclass(slots=True) only gains weakref_slot in Python 3.11; the
+    package supports 3.10, so the slot comes from this base instead.
+    """
+    
+    __slots__ = ('__weakref__',)
+
+
+@dataclass(slots=True)
+class Sprite(_Weakrefable):
     """
     ASCII sprite representation.
     
@@ -16,6 +35,30 @@ class Sprite:
     
     lines: List[str] = field(default_factory=list)
     color: int = 0
+    # Recomputed whenever lines is assigned
+    width: int = field(init=False)
+    height: int = field(init=False)
+    # (row, col, text) for each opaque run, built with lines so drawing
+    # copies whole runs instead of testing every cell for transparency
+    runs: List[Tuple[int, int, str]] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name, value):
+        if name == 'lines':
+            # Animate by assigning new lines; editing the list in place
+            # would leave width, height and runs stale
+            width = max(map(len, value)) if value else 0
+            object.__setattr__(self, 'width', width)
+            object.__setattr__(self, 'height', len(value))
+            # Pad to a rectangle; the padding is transparent
+            value = [line.ljust(width) for line in value]
+            object.__setattr__(self, 'runs', [
+                (row, match.start(), match.group())
+                for row, line in enumerate(value)
+                for match in _OPAQUE_RUN.finditer(line)
+            ])
+        object.__setattr__(self, name, value)
     
     @classmethod
     def from_string(cls, art: str, color: int = 0) -> 'Sprite':
@@ -45,24 +88,16 @@ class Sprite:
             New Sprite instance
         """
         return cls(lines=[char], color=color)
-    
-    @property
-    def width(self) -> int:
-        """Get sprite width"""
-        return max(len(line) for line in self.lines) if self.lines else 0
-    
-    @property
-    def height(self) -> int:
-        """Get sprite height"""
-        return len(self.lines)
 
 
-@dataclass
-class Entity:
+@dataclass(slots=True)
+class Entity(_Weakrefable):
     """
     Base class for all game entities.
     
     An entity has a position, velocity, and optional sprite.
+    Entities use __slots__, so extra attributes (e.g. hit points)
+    need a subclass: plain Entity instances reject unknown attributes.
     """
     
     x: float = 0.0
@@ -96,7 +131,10 @@ class Entity:
     @property
     def bounds(self) -> tuple[int, int, int, int]:
         """Get bounding box (x, y, width, height)"""
-        return (self.ix, self.iy, self.width, self.height)
+        sprite = self.sprite
+        if sprite:
+            return (int(self.x), int(self.y), sprite.width, sprite.height)
+        return (int(self.x), int(self.y), 1, 1)
     
     def move(self, dx: float = 0, dy: float = 0):
         """Move entity by delta"""
@@ -139,18 +177,14 @@ class Entity:
             return
             
         if self.sprite:
-            for row, line in enumerate(self.sprite.lines):
-                for col, char in enumerate(line):
-                    if char != ' ':  # Skip transparent pixels
-                        screen.draw_char(
-                            self.ix + col,
-                            self.iy + row,
-                            char,
-                            self.sprite.color
-                        )
+            # Spaces are transparent, so only the opaque runs are copied
+            x, y = self.ix, self.iy
+            color = self.sprite.color
+            for row, col, text in self.sprite.runs:
+                screen.draw_text(x + col, y + row, text, color)
         else:
             # Default: draw a single character
-            screen.draw_char(self.ix, self.iy, '█')
+            screen.draw_char(self.ix, self.iy, POINT_CHAR)
     
     def collides_with(self, other: 'Entity') -> bool:
         """
@@ -162,11 +196,14 @@ class Entity:
         Returns:
             True if entities overlap
         """
+        # Two bounds lookups instead of eight separate property calls
+        x, y, width, height = self.bounds
+        ox, oy, owidth, oheight = other.bounds
         return (
-            self.ix < other.ix + other.width and
-            self.ix + self.width > other.ix and
-            self.iy < other.iy + other.height and
-            self.iy + self.height > other.iy
+            x < ox + owidth and
+            x + width > ox and
+            y < oy + oheight and
+            y + height > oy
         )
     
     def contains_point(self, px: int, py: int) -> bool:
@@ -180,56 +217,139 @@ class Entity:
         Returns:
             True if point is inside
         """
-        return (
-            self.ix <= px < self.ix + self.width and
-            self.iy <= py < self.iy + self.height
-        )
+        x, y, width, height = self.bounds
+        return x <= px < x + width and y <= py < y + height
 
 
 class EntityGroup:
     """
     A collection of entities for batch operations.
+    
+    Iterating the group walks a snapshot, so entities can be added or
+    removed inside the loop.
     """
     
     def __init__(self):
-        self.entities: List[Entity] = []
+        # Keyed by id() so removal is O(1) and never compares entities
+        # field by field; dicts keep insertion order, which is draw order
+        self._entities: Dict[int, Entity] = {}
+    
+    @property
+    def entities(self) -> Tuple[Entity, ...]:
+        """
+        The entities in the order they were added.
+        
+        A snapshot tuple: index and iterate it freely, but change the
+        group with add() and remove() (or assign a new list).
+        """
+        return tuple(self._entities.values())
+    
+    @entities.setter
+    def entities(self, entities: List[Entity]):
+        self._entities = {id(e): e for e in entities}
     
     def add(self, entity: Entity) -> Entity:
         """Add an entity to the group"""
-        self.entities.append(entity)
+        self._entities[id(entity)] = entity
         return entity
     
     def remove(self, entity: Entity):
         """Remove an entity from the group"""
-        if entity in self.entities:
-            self.entities.remove(entity)
+        self._entities.pop(id(entity), None)
     
     def clear(self):
         """Remove all entities"""
-        self.entities.clear()
+        self._entities.clear()
     
     def update(self, dt: float = 1.0):
         """Update all active entities"""
-        for entity in self.entities:
+        base_update = Entity.update
+        # Snapshot, since an entity's update may add or remove entities
+        for entity in tuple(self._entities.values()):
             if entity.active:
-                entity.update(dt)
+                if type(entity).update is base_update:
+                    # Plain velocity step inlined to skip the method call
+                    entity.x += entity.vx
+                    entity.y += entity.vy
+                else:
+                    entity.update(dt)
     
     def draw(self, screen: 'Screen'):
         """Draw all active entities"""
-        for entity in self.entities:
-            if entity.active:
+        base_draw = Entity.draw
+        # Sprite-less entities (bullets, particles...) are batched into one
+        # draw_points call; the batch is flushed before any other entity
+        # draws so overlapping entities keep their order
+        points = []
+        for entity in self._entities.values():
+            if not entity.active:
+                continue
+            if not entity.sprite and type(entity).draw is base_draw:
+                points.append((int(entity.x), int(entity.y)))
+            else:
+                if points:
+                    screen.draw_points(points, POINT_CHAR)
+                    points = []
                 entity.draw(screen)
+        if points:
+            screen.draw_points(points, POINT_CHAR)
     
     def get_by_tag(self, tag: str) -> List[Entity]:
         """Get all entities with a specific tag"""
-        return [e for e in self.entities if e.tag == tag]
+        return [e for e in self._entities.values() if e.tag == tag]
+    
+    def within_radius(self, cx: float, cy: float, radius: float) -> List[Entity]:
+        """Get all active entities whose position is within radius of (cx, cy)"""
+        # Compare squared distances so no square root is taken per entity
+        r2 = radius * radius
+        found = []
+        for e in self._entities.values():
+            if e.active:
+                dx = e.x - cx
+                dy = e.y - cy
+                if dx * dx + dy * dy <= r2:
+                    found.append(e)
+        return found
+    
+    def collide_all(self) -> List[Tuple[Entity, Entity]]:
+        """
+        Find every pair of colliding active entities.
+        
+        Uses sort-and-sweep on the x axis, so only entities whose
+        x ranges overlap are tested against each other instead of
+        checking all N*N pairs.
+        
+        Returns:
+            List of (entity, entity) pairs that overlap
+        """
+        boxes = []
+        for e in self._entities.values():
+            if e.active:
+                x, y, width, height = e.bounds
+                boxes.append((x, x + width, y, y + height, e))
+        boxes.sort(key=lambda box: box[0])
+        pairs = []
+        sweep = []
+        for box in boxes:
+            x0, x1, y0, y1, entity = box
+            # Drop boxes that end before this one starts; none of the
+            # remaining boxes can reach them either
+            sweep = [other for other in sweep if other[1] > x0]
+            for ox0, _, oy0, oy1, other in sweep:
+                if ox0 < x1 and y0 < oy1 and oy0 < y1:
+                    pairs.append((other, entity))
+            sweep.append(box)
+        return pairs
     
     def remove_inactive(self):
         """Remove all inactive entities"""
-        self.entities = [e for e in self.entities if e.active]
+        self._entities = {
+            key: e for key, e in self._entities.items() if e.active
+        }
     
     def __iter__(self):
-        return iter(self.entities)
+        # Snapshot so the usual despawn loop can call remove() safely
+        return iter(tuple(self._entities.values()))
     
     def __len__(self):
-        return len(self.entities)
+        return len(self._entities)
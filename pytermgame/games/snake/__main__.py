@@ -2,7 +2,7 @@
 Run the Snake game.
 """
 
-from games.snake.main import main
+from pytermgame.games.snake.main import main
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,418 @@
+"""
+Snake Game - Classic snake game using PyTermGame engine.
+
+Controls:
+    - Arrow keys or WASD to move
+    - Q or ESC to quit
+    - R to restart after game over
+
+Run with:
+    python -m pytermgame.games.snake
+"""
+
+from collections import deque
+
+from pytermgame.engine import Game
+from pytermgame.input import Keys
+from pytermgame.utils import Color, CellPool
+
+# Game constants
+GAME_WIDTH = 60
+GAME_HEIGHT = 20
+PLAY_AREA_X = 2
+PLAY_AREA_Y = 3
+PLAY_WIDTH = GAME_WIDTH - 4
+PLAY_HEIGHT = GAME_HEIGHT - 4
+PLAY_RIGHT = PLAY_AREA_X + PLAY_WIDTH     # first column past the play area
+PLAY_BOTTOM = PLAY_AREA_Y + PLAY_HEIGHT   # first row past the play area
+
+# Snake characters (ASCII compatible)
+SNAKE_HEAD = '#'
+SNAKE_BODY = 'O'
+FOOD = '*'
+
+# Directions
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+
+# Board cells are packed into one int, (y << 16) | x, so they hash fast and
+# a move is a single add of the direction's packed step
+CELL_SHIFT = 16
+CELL_MASK = (1 << CELL_SHIFT) - 1
+
+# Direction -> packed step
+DIRECTION_STEPS = {
+    UP: -(1 << CELL_SHIFT),
+    DOWN: 1 << CELL_SHIFT,
+    LEFT: -1,
+    RIGHT: 1,
+}
+
+
+def pack_cell(x: int, y: int) -> int:
+    """Pack board coordinates into a cell id."""
+    return (y << CELL_SHIFT) | x
+
+
+def unpack_cell(cell: int) -> tuple[int, int]:
+    """Unpack a cell id into (x, y)."""
+    return cell & CELL_MASK, cell >> CELL_SHIFT
+
+
+# Key code -> direction (arrows and WASD, either case)
+KEY_DIRECTIONS = {
+    Keys.UP: UP, ord('w'): UP, ord('W'): UP,
+    Keys.DOWN: DOWN, ord('s'): DOWN, ord('S'): DOWN,
+    Keys.LEFT: LEFT, ord('a'): LEFT, ord('A'): LEFT,
+    Keys.RIGHT: RIGHT, ord('d'): RIGHT, ord('D'): RIGHT,
+}
+
+
+class SnakeGame(Game):
+    """Classic Snake game implementation."""
+    
+    __slots__ = (
+        'snake', 'food', 'direction', 'next_direction',
+        'score', 'high_score', 'game_over', 'paused',
+        'vertical_frame_skip', 'boosting', 'boost_frame_counter',
+        '_snake_set', '_free', '_dirty', '_force_redraw', '_drawn_overlay', '_drawn_status',
+    )
+    
+    # draw() only repaints the cells that changed since the last frame
+    auto_clear = False
+    
+    MIN_SNAKE_LENGTH = 3  # Can't boost below this length
+    
+    def __init__(self):
+        super().__init__(
+            width=GAME_WIDTH,
+            height=GAME_HEIGHT,
+            fps=8,  # Snake moves 8 times per second
+            title="Snake Game"
+        )
+        
+    def setup(self):
+        """Initialize game state."""
+        self.reset_game()
+        
+    def reset_game(self):
+        """Reset the game to initial state."""
+        # Snake starts in the center
+        center_x = PLAY_AREA_X + PLAY_WIDTH // 2
+        center_y = PLAY_AREA_Y + PLAY_HEIGHT // 2
+        
+        # Snake body as deque of packed cells, head is first
+        self.snake = deque([
+            pack_cell(center_x, center_y),
+            pack_cell(center_x - 1, center_y),
+            pack_cell(center_x - 2, center_y),
+        ])
+        # Same cells as a set for O(1) collision checks
+        self._snake_set = set(self.snake)
+        
+        # Play area cells not covered by the snake (where food may spawn)
+        self._free = CellPool(
+            pack_cell(x, y)
+            for y in range(PLAY_AREA_Y, PLAY_AREA_Y + PLAY_HEIGHT)
+            for x in range(PLAY_AREA_X, PLAY_AREA_X + PLAY_WIDTH)
+            if pack_cell(x, y) not in self._snake_set
+        )
+        
+        # Initial direction
+        self.direction = RIGHT
+        self.next_direction = RIGHT
+        
+        # Game state
+        self.score = 0
+        self.high_score = getattr(self, 'high_score', 0)
+        self.game_over = False
+        self.paused = False
+        
+        # Vertical movement compensation (skip frames when moving up/down)
+        self.vertical_frame_skip = 0
+        
+        # Boost mechanic - hold SPACE to go 2x speed but lose length
+        self.boosting = False
+        self.boost_frame_counter = 0
+        
+        # Cells changed since the last draw: cell -> (char, color)
+        self._dirty = {}
+        self._force_redraw = True
+        self._drawn_overlay = None
+        self._drawn_status = None
+        
+        # Spawn initial food
+        self.spawn_food()
+        
+    def spawn_food(self):
+        """Spawn food at a random position not occupied by snake."""
+        if not self._free:
+            # The snake fills the whole board - nothing left to eat
+            self.end_game()
+            return
+        self.food = self._free.choice()
+        self._dirty[self.food] = (FOOD, Color.RED)
+    
+    def end_game(self):
+        """Finish the current round and record the high score."""
+        self.game_over = True
+        if self.score > self.high_score:
+            self.high_score = self.score
+        
+    def update(self, dt: float):
+        """Update game logic."""
+        if self.game_over:
+            # Check for restart
+            if self.is_key_pressed(Keys.R):
+                self.reset_game()
+            return
+            
+        if self.paused:
+            if self.is_key_pressed(Keys.P):
+                self.paused = False
+            return
+        
+        # Hot attributes as locals (this runs every tick)
+        snake = self.snake
+        
+        # Check for boost - SPACE key activates boost if snake is long enough
+        keys = self.get_keys()
+        can_boost = len(snake) > self.MIN_SNAKE_LENGTH
+        
+        # Only boost if SPACE is pressed AND we can boost
+        # Still allow movement while boosting - don't block other keys
+        boosting = self.boosting = can_boost and self.is_key_pressed(Keys.SPACE)
+        
+        # Handle input - change direction (every key pressed this frame, so a
+        # turn typed together with SPACE is not dropped)
+        for key in keys:
+            if key == Keys.P:
+                self.paused = True
+                return
+            self._steer(key)
+        
+        # Apply direction change
+        direction = self.direction = self.next_direction
+        
+        # Skip every other frame when moving vertically (compensate for tall characters)
+        # But don't skip if boosting
+        is_vertical = direction[0] == 0
+        if is_vertical and not boosting:
+            self.vertical_frame_skip += 1
+            if self.vertical_frame_skip % 2 == 0:
+                return  # Skip this frame for vertical movement
+        
+        # Move snake (the play area never touches row/column 0, so the packed
+        # add cannot borrow across the x/y fields)
+        old_head = snake[0]
+        new_head = old_head + DIRECTION_STEPS[direction]
+        
+        # Check wall collision
+        if not (PLAY_AREA_X <= new_head & CELL_MASK < PLAY_RIGHT and
+                PLAY_AREA_Y <= new_head >> CELL_SHIFT < PLAY_BOTTOM):
+            self.end_game()
+            return
+            
+        # Check self collision
+        snake_set = self._snake_set
+        if new_head in snake_set:
+            self.end_game()
+            return
+            
+        # Add new head (the old head becomes body)
+        dirty = self._dirty
+        dirty[old_head] = (SNAKE_BODY, Color.GREEN)
+        dirty[new_head] = (SNAKE_HEAD, Color.GREEN)
+        snake.appendleft(new_head)
+        snake_set.add(new_head)
+        self._free.discard(new_head)
+        
+        # Check food collision
+        if new_head == self.food:
+            self.score += 10
+            self.spawn_food()
+            # Increase speed slightly every 50 points
+            if self.score % 50 == 0 and self.target_fps < 15:
+                self.target_fps += 1
+        else:
+            # Remove tail (snake doesn't grow)
+            self._drop_tail()
+            
+        # Boost mechanic: shrink snake while boosting
+        if boosting and len(snake) > self.MIN_SNAKE_LENGTH:
+            self.boost_frame_counter += 1
+            # Shrink every 3 frames while boosting
+            if self.boost_frame_counter % 3 == 0:
+                self._drop_tail()  # Remove extra tail segment
+            
+    def on_input(self, keys):
+        """Steer as soon as a key arrives instead of on the next tick."""
+        if not self.game_over and not self.paused:
+            for key in keys:
+                self._steer(key)
+    
+    def _steer(self, key: int):
+        """Queue the direction for a key, ignoring 180-degree turns."""
+        new_dir = KEY_DIRECTIONS.get(key)
+        if new_dir:
+            # Opposite directions cancel out
+            dx, dy = self.direction
+            if new_dir[0] + dx or new_dir[1] + dy:
+                self.next_direction = new_dir
+            
+    def _drop_tail(self):
+        """Remove the last body segment and free its cell."""
+        tail = self.snake.pop()
+        self._snake_set.discard(tail)
+        self._free.add(tail)
+        self._dirty[tail] = (' ', Color.DEFAULT)
+            
+    def draw(self):
+        """Draw the game."""
+        overlay = 'game_over' if self.game_over else 'paused' if self.paused else None
+        
+        if self._force_redraw or overlay != self._drawn_overlay:
+            # Start, restart or an overlay opened/closed: repaint everything
+            self._draw_full()
+            self._force_redraw = False
+            self._drawn_overlay = overlay
+        else:
+            # Only the head, neck, tail and food moved since last frame
+            draw_char = self.screen.draw_char
+            for cell, (char, color) in self._dirty.items():
+                draw_char(cell & CELL_MASK, cell >> CELL_SHIFT, char, color)
+        self._dirty.clear()
+        
+        self._draw_status()
+        
+        # Draw overlays
+        if self.game_over:
+            self._draw_game_over()
+        elif self.paused:
+            self._draw_paused()
+    
+    def _draw_full(self):
+        """Redraw the whole board from scratch."""
+        self.screen.clear()
+        self._drawn_status = None
+        
+        # Draw border
+        self.screen.draw_box(0, 0, GAME_WIDTH, GAME_HEIGHT, color=Color.CYAN)
+        
+        # Draw title bar
+        title = " SNAKE GAME "
+        self.screen.draw_text(
+            (GAME_WIDTH - len(title)) // 2, 0,
+            title,
+            Color.GREEN
+        )
+        
+        # Draw separator
+        self.screen.draw_hline(1, 2, GAME_WIDTH - 2, '-', Color.CYAN)
+        
+        # Draw play area border (inner)
+        self.screen.draw_hline(PLAY_AREA_X - 1, PLAY_AREA_Y - 1, PLAY_WIDTH + 2, '.', Color.BLUE)
+        self.screen.draw_hline(
+            PLAY_AREA_X - 1, PLAY_AREA_Y + PLAY_HEIGHT, PLAY_WIDTH + 2, '.', Color.BLUE
+        )
+        self.screen.draw_vline(PLAY_AREA_X - 1, PLAY_AREA_Y, PLAY_HEIGHT, '.', Color.BLUE)
+        self.screen.draw_vline(PLAY_AREA_X + PLAY_WIDTH, PLAY_AREA_Y, PLAY_HEIGHT, '.', Color.BLUE)
+        
+        # Draw food
+        food_x, food_y = unpack_cell(self.food)
+        self.screen.draw_char(food_x, food_y, FOOD, Color.RED)
+        
+        # Draw snake body, then the head over the first cell
+        draw_char = self.screen.draw_char
+        for cell in self.snake:
+            draw_char(cell & CELL_MASK, cell >> CELL_SHIFT, SNAKE_BODY, Color.GREEN)
+        head_x, head_y = unpack_cell(self.snake[0])
+        self.screen.draw_char(head_x, head_y, SNAKE_HEAD, Color.GREEN)
+        
+        # Draw controls hint
+        controls = "WASD:Move | SPACE:Boost | P:Pause | Q:Quit"
+        self.screen.draw_text(
+            (GAME_WIDTH - len(controls)) // 2,
+            GAME_HEIGHT - 1,
+            controls,
+            Color.WHITE
+        )
+    
+    def _draw_status(self):
+        """Draw the score line (row 1) if anything on it changed."""
+        can_boost = len(self.snake) > self.MIN_SNAKE_LENGTH
+        status = (self.score, self.high_score, self.boosting, can_boost)
+        if status == self._drawn_status:
+            return
+        self._drawn_status = status
+        
+        self.screen.draw_hline(1, 1, GAME_WIDTH - 2, ' ')
+        
+        # Draw score
+        score_text = f" Score: {self.score} "
+        self.screen.draw_text(2, 1, score_text, Color.YELLOW)
+        
+        high_score_text = f" High: {self.high_score} "
+        self.screen.draw_text(GAME_WIDTH - len(high_score_text) - 2, 1, high_score_text, Color.MAGENTA)
+        
+        # Draw boost indicator
+        if self.boosting:
+            boost_text = " BOOST! "
+            self.screen.draw_text(GAME_WIDTH // 2 - 4, 1, boost_text, Color.RED)
+        elif not can_boost:
+            boost_text = " [NO BOOST] "
+            self.screen.draw_text(GAME_WIDTH // 2 - 6, 1, boost_text, Color.BLUE)
+            
+    def _draw_game_over(self):
+        """Draw game over overlay."""
+        box_width = 28
+        box_height = 7
+        box_x = (GAME_WIDTH - box_width) // 2
+        box_y = (GAME_HEIGHT - box_height) // 2
+        
+        # Clear area
+        self.screen.fill_rect(box_x, box_y, box_width, box_height, ' ')
+        
+        # Draw box
+        self.screen.draw_box(box_x, box_y, box_width, box_height, color=Color.RED)
+        
+        # Draw text
+        self.screen.draw_text(box_x + 8, box_y + 2, "GAME OVER!", Color.RED)
+        self.screen.draw_text(box_x + 4, box_y + 4, f"Final Score: {self.score}", Color.YELLOW)
+        self.screen.draw_text(box_x + 3, box_y + 5, "Press R to Restart", Color.WHITE)
+        
+    def _draw_paused(self):
+        """Draw pause overlay."""
+        box_width = 22
+        box_height = 5
+        box_x = (GAME_WIDTH - box_width) // 2
+        box_y = (GAME_HEIGHT - box_height) // 2
+        
+        self.screen.fill_rect(box_x, box_y, box_width, box_height, ' ')
+        self.screen.draw_box(box_x, box_y, box_width, box_height, color=Color.YELLOW)
+        self.screen.draw_text(box_x + 7, box_y + 2, "PAUSED", Color.YELLOW)
+        self.screen.draw_text(box_x + 2, box_y + 3, "Press P to Resume", Color.WHITE)
+        
+    def on_quit(self) -> bool:
+        """Handle quit - ask for confirmation if in game."""
+        if self.game_over:
+            return True
+        return True
+
+
+def main():
+    """Entry point for the Snake game."""
+    try:
+        game = SnakeGame()
+        game.run()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
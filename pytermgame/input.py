@@ -2,14 +2,8 @@
 Input module - Keyboard input handling
 """
 
-try:
-    import curses
-    CURSES_AVAILABLE = True
-except ImportError:
-    CURSES_AVAILABLE = False
-
 from enum import IntEnum
-from typing import Optional, Set
+from typing import Optional, Set, List, Tuple
 
 
 class Keys(IntEnum):
@@ -68,6 +62,117 @@ class Keys(IntEnum):
     NUM_9 = ord('9')
 
 
+# Escape sequences sent by terminals for arrow keys (normal and application mode)
+ANSI_KEY_SEQUENCES = {
+    b'\x1b[A': Keys.UP,
+    b'\x1b[B': Keys.DOWN,
+    b'\x1b[C': Keys.RIGHT,
+    b'\x1b[D': Keys.LEFT,
+    b'\x1bOA': Keys.UP,
+    b'\x1bOB': Keys.DOWN,
+    b'\x1bOC': Keys.RIGHT,
+    b'\x1bOD': Keys.LEFT,
+}
+
+
+def _split_ansi_keys(data: bytes, hold_escape: bool = False) -> Tuple[List[int], bytes]:
+    """
+    Decode raw terminal input, stopping at an unterminated escape sequence.
+    
+    CSI ("ESC [" parameters, final byte 0x40-0x7E) and SS3 ("ESC O" plus
+    one byte) sequences are consumed whole; those not in
+    ANSI_KEY_SEQUENCES (Home, F-keys, Ctrl+arrows...) are dropped.
+    
+    Args:
+        data: Raw input bytes
+        hold_escape: Treat an ESC at the very end as a possible sequence
+            start and return it in rest instead of as Keys.ESCAPE
+    
+    Returns:
+        (keys, rest) where rest is a trailing incomplete sequence
+    """
+    keys = []
+    i = 0
+    n = len(data)
+    while i < n:
+        byte = data[i]
+        if byte == Keys.ESCAPE and i + 1 >= n and hold_escape:
+            return keys, data[i:]
+        if byte != Keys.ESCAPE or i + 1 >= n or data[i + 1] not in b'[O':
+            # Ordinary byte, or an ESC that does not start a sequence
+            keys.append(byte)
+            i += 1
+            continue
+        
+        j = i + 2
+        if data[i + 1] == ord('['):
+            # Skip parameter and intermediate bytes
+            while j < n and 0x20 <= data[j] < 0x40:
+                j += 1
+        if j >= n:
+            return keys, data[i:]
+        if 0x40 <= data[j] <= 0x7E:
+            key = ANSI_KEY_SEQUENCES.get(data[i:j + 1])
+            if key is not None:
+                keys.append(key)
+            j += 1
+        # A malformed sequence is dropped up to the offending byte
+        i = j
+    return keys, b''
+
+
+def decode_ansi_keys(data: bytes) -> List[int]:
+    """
+    Convert raw terminal input into key codes.
+    
+    Unknown escape sequences are dropped, and Keys.ESCAPE is only
+    reported for a lone ESC. An escape sequence cut off at the end of
+    data is discarded; use ANSIKeyDecoder to keep it for the next read.
+    
+    Args:
+        data: Bytes read from stdin (may hold several key presses)
+        
+    Returns:
+        List of key codes in the order they were typed
+    """
+    return _split_ansi_keys(data)[0]
+
+
+class ANSIKeyDecoder:
+    """
+    Incremental decode_ansi_keys for successive reads from a terminal.
+    
+    An escape sequence split across two reads is held back until the
+    rest of it arrives. That includes a read ending in a bare ESC: it is
+    reported as Keys.ESCAPE once the next read is empty or does not
+    continue with '[' or 'O'.
+    """
+    
+    def __init__(self):
+        self._partial = b''
+    
+    def feed(self, data: bytes) -> List[int]:
+        """
+        Decode the next chunk of input.
+        
+        Args:
+            data: Bytes read from stdin
+            
+        Returns:
+            Key codes completed by this chunk
+        """
+        if not data and self._partial == b'\x1b':
+            # Nothing followed the held ESC: it was the escape key itself
+            self._partial = b''
+            return [Keys.ESCAPE]
+        keys, self._partial = _split_ansi_keys(self._partial + data, hold_escape=True)
+        return keys
+    
+    def reset(self):
+        """Forget any partially received escape sequence"""
+        self._partial = b''
+
+
 class InputHandler:
     """
     Handles keyboard input for games.
@@ -87,6 +192,18 @@ class InputHandler:
         ord('D'): Keys.RIGHT,
     }
     
+    # Key codes covered by the translation table (curses keys are < 512)
+    KEY_TABLE_SIZE = 512
+    
+    DIRECTION_KEYS = frozenset((Keys.UP, Keys.DOWN, Keys.LEFT, Keys.RIGHT))
+    
+    DIRECTIONS = {
+        Keys.UP: (0, -1),
+        Keys.DOWN: (0, 1),
+        Keys.LEFT: (-1, 0),
+        Keys.RIGHT: (1, 0),
+    }
+    
     def __init__(self, use_wasd: bool = True):
         """
         Initialize input handler.
@@ -95,6 +212,10 @@ class InputHandler:
             use_wasd: Whether to map WASD keys to arrow keys
         """
         self.use_wasd = use_wasd
+        # Translation table indexed by key code: identity except for WASD
+        self._key_table: List[int] = list(range(self.KEY_TABLE_SIZE))
+        for key, mapped in self.WASD_MAP.items():
+            self._key_table[key] = mapped
         self._pressed_keys: Set[int] = set()
         self._just_pressed: Set[int] = set()
         self._just_released: Set[int] = set()
@@ -114,8 +235,8 @@ class InputHandler:
             return None
         
         # Apply WASD mapping if enabled
-        if self.use_wasd and key in self.WASD_MAP:
-            key = self.WASD_MAP[key]
+        if self.use_wasd and 0 <= key < self.KEY_TABLE_SIZE:
+            key = self._key_table[key]
         
         self._last_key = key
         
@@ -153,7 +274,7 @@ class InputHandler:
     
     def is_direction_key(self, key: int) -> bool:
         """Check if a key is a direction key (arrow or WASD)"""
-        return key in (Keys.UP, Keys.DOWN, Keys.LEFT, Keys.RIGHT)
+        return key in self.DIRECTION_KEYS
     
     def get_direction(self, key: int) -> tuple[int, int]:
         """
@@ -162,10 +283,4 @@ class InputHandler:
         Returns:
             (dx, dy) tuple where each is -1, 0, or 1
         """
-        directions = {
-            Keys.UP: (0, -1),
-            Keys.DOWN: (0, 1),
-            Keys.LEFT: (-1, 0),
-            Keys.RIGHT: (1, 0),
-        }
-        return directions.get(key, (0, 0))
+        return self.DIRECTIONS.get(key, (0, 0))
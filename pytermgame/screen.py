@@ -5,16 +5,20 @@ Supports both curses and ANSI escape codes.
 """
 
 import os
+import queue
 import sys
-from typing import Optional
+import threading
+from array import array
+from typing import Iterable, Optional, Tuple
 
-# Try to import curses (works on Windows with windows-curses)
-try:
-    import curses
-    CURSES_AVAILABLE = True
-except ImportError:
-    CURSES_AVAILABLE = False
-    curses = None  # type: ignore
+from .utils import optional_import
+
+
+def __getattr__(name):
+    """Lazily probe for curses (works on Windows with windows-curses)."""
+    if name == "CURSES_AVAILABLE":
+        return optional_import('curses') is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ANSI color codes
@@ -33,34 +37,134 @@ class ANSIColors:
     ]
 
 
+# Escape code for every possible color byte, so a color change is one
+# index with no range check; 0 and unknown colors reset to the default
+_COLOR_CODES = tuple(
+    ANSIColors.COLORS[color] if 0 < color < len(ANSIColors.COLORS)
+    else ANSIColors.RESET
+    for color in range(256)
+)
+
+
+def _color_byte(color: int) -> int:
+    """Clamp a color to the one byte stored per cell (unknown colors render as default)"""
+    return color if 0 <= color <= 255 else 0
+
+
+def _write_all(fd: int, data):
+    """Write all of data to a file descriptor, finishing partial writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    view.release()
+
+
+class AsyncWriter:
+    """
+    Writes frames to a file descriptor from a background thread.
+    
+    The game loop hands a frame over and carries on while a slow terminal
+    (e.g. over SSH) drains it. Frames are written in order; submit() only
+    blocks when the writer is more than max_pending frames behind.
+    """
+    
+    def __init__(self, fd: int, max_pending: int = 4):
+        """
+        Start the writer thread.
+        
+        Args:
+            fd: File descriptor to write to
+            max_pending: Frames that may be queued before submit() blocks
+        """
+        self._fd = fd
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(max_pending)
+        self._error: Optional[OSError] = None
+        self._thread = threading.Thread(target=self._run, name="pytermgame-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, data: bytes):
+        """Queue a frame for writing (raises if an earlier write failed)"""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(data)
+    
+    def close(self):
+        """Write out every queued frame and stop the thread"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+    
+    def _run(self):
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            if self._error is None:
+                try:
+                    _write_all(self._fd, data)
+                except OSError as e:
+                    # Keep draining so submit() never blocks forever
+                    self._error = e
+
+
 class Screen:
     """
     Screen class for terminal rendering.
     
     Manages a character buffer and handles drawing operations.
     Uses curses when available, falls back to ANSI escape codes.
+    Colors outside 0-255 are drawn in the default color.
     """
     
-    def __init__(self, width: int = 80, height: int = 24):
+    # In ANSI mode, gaps of up to this many unchanged cells are repainted
+    # rather than jumped over, when their encoded bytes are no longer than
+    # the cursor move escape ("\033[y;xH") they replace
+    ANSI_MERGE_GAP = 4
+    
+    def __init__(self, width: int = 80, height: int = 24, async_output: bool = False):
         """
         Initialize a new screen.
         
         Args:
             width: Screen width in characters
             height: Screen height in characters
+            async_output: Write ANSI frames from a background thread so a
+                slow terminal does not stall the game loop
         """
         self.width = width
         self.height = height
-        self._buffer: list[list[str]] = []
-        self._color_buffer: list[list[int]] = []
+        # Back buffer: what is being drawn this frame (flat, row-major).
+        # Colors are one byte per cell; characters stay a list of str since
+        # glyphs like '█' do not fit in a byte.
+        self._chars: list[str] = []
+        self._colors = array('B')
+        # Front buffer: what the terminal is currently showing
+        self._front_chars: list[str] = []
+        self._front_colors = array('B')
         self._stdscr = None
+        self._curses = None
         self._curses_mode = False
+        # Terminal output queued for the next flush
+        self._pending = bytearray()
+        self._fd: Optional[int] = None
+        self._async_output = async_output
+        self._writer: Optional[AsyncWriter] = None
         self._clear_buffer()
+        self.invalidate()
         
     def _clear_buffer(self):
         """Clear the internal buffer"""
-        self._buffer = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        self._color_buffer = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        size = self.width * self.height
+        self._chars = [' '] * size
+        self._colors = array('B', bytes(size))
+    
+    def invalidate(self):
+        """Forget the terminal contents so the next refresh redraws every cell"""
+        size = self.width * self.height
+        # '' never matches a drawn character, so every cell counts as changed
+        self._front_chars = [''] * size
+        self._front_colors = array('B', bytes(size))
     
     def init_curses(self, stdscr) -> 'Screen':
         """
@@ -72,9 +176,11 @@ class Screen:
         Returns:
             self for chaining
         """
-        if not CURSES_AVAILABLE:
+        curses = optional_import('curses')
+        if curses is None:
             return self
             
+        self._curses = curses
         self._stdscr = stdscr
         self._curses_mode = True
         
@@ -101,8 +207,6 @@ class Screen:
     def clear(self):
         """Clear the screen buffer"""
         self._clear_buffer()
-        if self._curses_mode and self._stdscr:
-            self._stdscr.clear()
     
     def draw_char(self, x: int, y: int, char: str, color: int = 0):
         """
@@ -115,8 +219,9 @@ class Screen:
             color: Color pair number (0-7)
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self._buffer[y][x] = char[0] if char else ' '
-            self._color_buffer[y][x] = color
+            i = y * self.width + x
+            self._chars[i] = char[0] if char else ' '
+            self._colors[i] = color if 0 <= color <= 255 else 0
     
     def draw_text(self, x: int, y: int, text: str, color: int = 0):
         """
@@ -128,9 +233,38 @@ class Screen:
             text: Text to draw
             color: Color pair number
         """
-        for i, char in enumerate(text):
-            if x + i < self.width:
-                self.draw_char(x + i, y, char, color)
+        if not 0 <= y < self.height:
+            return
+        x0 = max(x, 0)
+        x1 = min(x + len(text), self.width)
+        if x0 >= x1:
+            return
+        # Copy the visible part of the string in one slice per buffer
+        row = y * self.width
+        self._chars[row + x0:row + x1] = text[x0 - x:x1 - x]
+        self._colors[row + x0:row + x1] = array('B', [_color_byte(color)]) * (x1 - x0)
+    
+    def draw_points(self, points: Iterable[Tuple[int, int]], char: str, color: int = 0):
+        """
+        Draw the same character at many positions.
+        
+        Equivalent to calling draw_char for each point, without the
+        per-point method call.
+        
+        Args:
+            points: (x, y) positions; off-screen points are skipped
+            char: Character to draw
+            color: Color pair number
+        """
+        char = char[0] if char else ' '
+        color = _color_byte(color)
+        chars, colors = self._chars, self._colors
+        width, height = self.width, self.height
+        for x, y in points:
+            if 0 <= x < width and 0 <= y < height:
+                i = y * width + x
+                chars[i] = char
+                colors[i] = color
     
     def draw_box(self, x: int, y: int, width: int, height: int, 
                  title: str = "", color: int = 0):
@@ -153,22 +287,18 @@ class Screen:
         HORIZONTAL = '-'
         VERTICAL = '|'
         
+        # Draw the edges as four slice fills, then put the corners on top
+        self.draw_hline(x, y, width, HORIZONTAL, color)
+        self.draw_hline(x, y + height - 1, width, HORIZONTAL, color)
+        self.draw_vline(x, y, height, VERTICAL, color)
+        self.draw_vline(x + width - 1, y, height, VERTICAL, color)
+        
         # Draw corners
         self.draw_char(x, y, TOP_LEFT, color)
         self.draw_char(x + width - 1, y, TOP_RIGHT, color)
         self.draw_char(x, y + height - 1, BOTTOM_LEFT, color)
         self.draw_char(x + width - 1, y + height - 1, BOTTOM_RIGHT, color)
         
-        # Draw horizontal lines
-        for i in range(1, width - 1):
-            self.draw_char(x + i, y, HORIZONTAL, color)
-            self.draw_char(x + i, y + height - 1, HORIZONTAL, color)
-        
-        # Draw vertical lines
-        for i in range(1, height - 1):
-            self.draw_char(x, y + i, VERTICAL, color)
-            self.draw_char(x + width - 1, y + i, VERTICAL, color)
-        
         # Draw title if provided
         if title:
             title_text = f" {title} "
@@ -177,71 +307,229 @@ class Screen:
     
     def draw_hline(self, x: int, y: int, length: int, char: str = '-', color: int = 0):
         """Draw a horizontal line"""
-        for i in range(length):
-            self.draw_char(x + i, y, char, color)
+        if not 0 <= y < self.height:
+            return
+        x0 = max(x, 0)
+        x1 = min(x + length, self.width)
+        if x0 >= x1:
+            return
+        # One slice assignment per buffer instead of a call per cell
+        row = y * self.width
+        self._chars[row + x0:row + x1] = [char[0] if char else ' '] * (x1 - x0)
+        self._colors[row + x0:row + x1] = array('B', [_color_byte(color)]) * (x1 - x0)
     
     def draw_vline(self, x: int, y: int, length: int, char: str = '|', color: int = 0):
         """Draw a vertical line"""
-        for i in range(length):
-            self.draw_char(x, y + i, char, color)
+        if not 0 <= x < self.width:
+            return
+        y0 = max(y, 0)
+        y1 = min(y + length, self.height)
+        if y0 >= y1:
+            return
+        # A column is every width-th cell of the flat buffer
+        start = y0 * self.width + x
+        stop = (y1 - 1) * self.width + x + 1
+        self._chars[start:stop:self.width] = [char[0] if char else ' '] * (y1 - y0)
+        self._colors[start:stop:self.width] = array('B', [_color_byte(color)]) * (y1 - y0)
     
     def fill_rect(self, x: int, y: int, width: int, height: int, 
                   char: str = ' ', color: int = 0):
         """Fill a rectangular area with a character"""
-        for row in range(height):
-            for col in range(width):
-                self.draw_char(x + col, y + row, char, color)
+        x0 = max(x, 0)
+        x1 = min(x + width, self.width)
+        if x0 >= x1:
+            return
+        # Build one clipped row and slice it into every covered line
+        chars = [char[0] if char else ' '] * (x1 - x0)
+        colors = array('B', [_color_byte(color)]) * (x1 - x0)
+        for y in range(max(y, 0), min(y + height, self.height)):
+            row = y * self.width
+            self._chars[row + x0:row + x1] = chars
+            self._colors[row + x0:row + x1] = colors
     
-    def refresh(self):
-        """Push the buffer to the terminal"""
+    def refresh(self, clear: bool = False):
+        """
+        Push the changed part of the buffer to the terminal.
+        
+        Args:
+            clear: Also clear the buffer for the next frame. Cheaper than
+                calling clear() separately since the drawn buffer simply
+                becomes the front buffer instead of being copied.
+        """
         if self._curses_mode and self._stdscr:
             self._refresh_curses()
         else:
             self._refresh_ansi()
+        # The terminal now shows the back buffer
+        if clear:
+            self._front_chars = self._chars
+            self._front_colors = self._colors
+            self._clear_buffer()
+        else:
+            self._front_chars[:] = self._chars
+            self._front_colors[:] = self._colors
+    
+    def _changed_runs(self):
+        """
+        Find the cells that differ from what the terminal is showing.
+        
+        Yields:
+            (start, end) flat index ranges of contiguous changed cells.
+            Runs never cross a row boundary.
+        """
+        chars, colors = self._chars, self._colors
+        front_chars, front_colors = self._front_chars, self._front_colors
+        width = self.width
+        for row in range(0, len(chars), width):
+            row_end = row + width
+            # Whole-row slice compares run in C; most rows are unchanged
+            if (chars[row:row_end] == front_chars[row:row_end]
+                    and colors[row:row_end] == front_colors[row:row_end]):
+                continue
+            
+            start = -1
+            for i in range(row, row_end):
+                if chars[i] != front_chars[i] or colors[i] != front_colors[i]:
+                    if start < 0:
+                        start = i
+                elif start >= 0:
+                    yield start, i
+                    start = -1
+            if start >= 0:
+                yield start, row_end
+    
+    def _color_segments(self, start: int, end: int):
+        """
+        Split a run of cells into same-colored segments.
+        
+        Yields:
+            (start, end, color) for each segment, in order
+        """
+        colors = self._colors
+        i = start
+        while i < end:
+            color = colors[i]
+            if colors[i:end].count(color) == end - i:
+                # Rest of the run is one color: no per-cell scan needed
+                yield i, end, color
+                return
+            j = i + 1
+            while colors[j] == color:
+                j += 1
+            yield i, j, color
+            i = j
     
     def _refresh_curses(self):
         """Refresh using curses"""
-        if not CURSES_AVAILABLE:
-            return
-        for y in range(self.height):
-            for x in range(self.width):
-                char = self._buffer[y][x]
-                color = self._color_buffer[y][x]
+        curses = self._curses
+        stdscr = self._stdscr
+        chars = self._chars
+        width = self.width
+        for start, end in self._changed_runs():
+            y, x = divmod(start, width)
+            # One addstr per color segment instead of an addch per cell
+            for i, j, color in self._color_segments(start, end):
+                attr = curses.color_pair(color) if color > 0 else 0
                 try:
-                    if color > 0:
-                        self._stdscr.addch(y, x, char, curses.color_pair(color))
-                    else:
-                        self._stdscr.addch(y, x, char)
-                except:
-                    # Ignore errors when writing to last cell
+                    stdscr.addstr(y, x + i - start, ''.join(chars[i:j]), attr)
+                except curses.error:
+                    # Writing the last cell (or past a shrunken terminal) fails
                     pass
-        self._stdscr.refresh()
+        stdscr.refresh()
     
     def _refresh_ansi(self):
         """Refresh using ANSI escape codes (fallback)"""
-        # Move cursor to home position
-        sys.stdout.write("\033[H")
-        
         output = []
-        for y, row in enumerate(self._buffer):
-            line_parts = []
-            current_color = -1
+        append = output.append
+        color_codes = _COLOR_CODES
+        chars, colors = self._chars, self._colors
+        width = self.width
+        # Terminal state is unknown until we set it this frame
+        cursor = -1
+        current_color = -1
+        
+        for start, end in self._changed_runs():
+            if start != cursor:
+                # Jump straight to the run instead of repainting from home
+                y, x = divmod(start, width)
+                move = f"\033[{y + 1};{x + 1}H"
+                gap = start - cursor
+                if (cursor >= 0 and gap <= self.ANSI_MERGE_GAP
+                        and start // width == cursor // width
+                        and colors[cursor:start].count(current_color) == gap):
+                    gap_text = ''.join(chars[cursor:start])
+                    # Glyphs like '█' take several UTF-8 bytes, so compare bytes
+                    if len(gap_text.encode()) <= len(move):
+                        move = gap_text
+                append(move)
             
-            for x, char in enumerate(row):
-                color = self._color_buffer[y][x]
+            # Emit one color code and one joined string per same-colored segment
+            for i, j, color in self._color_segments(start, end):
                 if color != current_color:
-                    if color > 0 and color < len(ANSIColors.COLORS):
-                        line_parts.append(ANSIColors.COLORS[color])
-                    else:
-                        line_parts.append(ANSIColors.RESET)
+                    append(color_codes[color])
                     current_color = color
-                line_parts.append(char)
+                append(''.join(chars[i:j]))
             
-            line_parts.append(ANSIColors.RESET)
-            output.append(''.join(line_parts))
+            # After the last column the cursor does not move on to the next row
+            cursor = end if end % width else -1
+        
+        if current_color > 0:
+            append(ANSIColors.RESET)
+        
+        if output:
+            # One encode per frame; glyphs may be non-ASCII so the text is
+            # joined first rather than encoded piece by piece
+            self.write(''.join(output))
+        self.flush()
+    
+    def write(self, data: str):
+        """
+        Queue raw terminal output (e.g. escape codes).
+        
+        Nothing reaches the terminal until flush() is called.
         
-        sys.stdout.write('\n'.join(output))
+        Args:
+            data: Text to send
+        """
+        self._pending += data.encode()
+    
+    def flush(self):
+        """Send all queued output to the terminal in a single write"""
+        if not self._pending:
+            return
+        if self._fd is None:
+            self._fd = self._output_fd()
+            if self._async_output and self._fd >= 0:
+                self._writer = AsyncWriter(self._fd)
+        
+        if self._writer is not None:
+            self._writer.submit(bytes(self._pending))
+        elif self._fd >= 0:
+            # Straight to the file descriptor, skipping the TextIO layers
+            _write_all(self._fd, self._pending)
+        else:
+            # No real file behind stdout (e.g. redirected to a StringIO)
+            sys.stdout.write(self._pending.decode())
+            sys.stdout.flush()
+        self._pending.clear()
+    
+    def close(self):
+        """Send any queued output and stop the background writer"""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._fd = None
+    
+    def _output_fd(self) -> int:
+        """Get the stdout file descriptor, or -1 if stdout has none"""
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            return -1
+        # Anything already printed must go out before our raw writes
         sys.stdout.flush()
+        return fd
     
     def get_input(self) -> Optional[int]:
         """
@@ -253,9 +541,14 @@ class Screen:
         if self._curses_mode and self._stdscr:
             try:
                 key = self._stdscr.getch()
-                return key if key != -1 else None
             except:
                 return None
+            if key == -1:
+                return None
+            if key == self._curses.KEY_RESIZE:
+                # The terminal contents are gone - repaint every cell
+                self.invalidate()
+            return key
         return None
     
     @property
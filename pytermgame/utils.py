@@ -2,8 +2,10 @@
 Utils module - Utility functions and constants
 """
 
+import importlib
 import random
-from typing import Tuple, List
+from types import ModuleType
+from typing import Tuple, List, Dict, Hashable, Iterable, Iterator, Optional
 
 
 # Color constants (curses color pair numbers)
@@ -19,6 +21,30 @@ class Color:
     WHITE = 7
 
 
+_optional_modules: Dict[str, Optional[ModuleType]] = {}
+
+
+def optional_import(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional (platform-specific) module on first use.
+    
+    Lets modules like curses or msvcrt be probed only when a game actually
+    needs them. The result is cached.
+    
+    Args:
+        name: Module name
+        
+    Returns:
+        The module, or None if it is not available
+    """
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    return _optional_modules[name]
+
+
 def random_position(
     min_x: int, max_x: int,
     min_y: int, max_y: int
@@ -29,16 +55,17 @@ def random_position(
     Returns:
         (x, y) tuple
     """
+    # randrange is what randint calls internally; same numbers, one call less
     return (
-        random.randint(min_x, max_x - 1),
-        random.randint(min_y, max_y - 1)
+        random.randrange(min_x, max_x),
+        random.randrange(min_y, max_y)
     )
 
 
 def random_position_excluding(
     min_x: int, max_x: int,
     min_y: int, max_y: int,
-    exclude: List[Tuple[int, int]],
+    exclude: Iterable[Tuple[int, int]],
     max_attempts: int = 100
 ) -> Tuple[int, int]:
     """
@@ -46,19 +73,78 @@ def random_position_excluding(
     
     Args:
         min_x, max_x, min_y, max_y: Bounds
-        exclude: List of (x, y) positions to avoid
-        max_attempts: Maximum attempts before giving up
+        exclude: (x, y) positions to avoid
+        max_attempts: Random guesses to try before scanning for free cells
         
     Returns:
-        (x, y) tuple, may overlap if max_attempts exceeded
+        (x, y) tuple, may overlap only if every position is excluded
     """
+    # Set membership is O(1) per guess instead of a list scan
+    excluded = exclude if isinstance(exclude, (set, frozenset)) else set(exclude)
+    # Bound once; still the module RNG so random.seed() keeps working
+    randrange = random.randrange
     for _ in range(max_attempts):
-        pos = random_position(min_x, max_x, min_y, max_y)
-        if pos not in exclude:
+        pos = (randrange(min_x, max_x), randrange(min_y, max_y))
+        if pos not in excluded:
             return pos
+    
+    # The area is nearly full: pick from the free cells directly
+    free = [
+        (x, y)
+        for y in range(min_y, max_y)
+        for x in range(min_x, max_x)
+        if (x, y) not in excluded
+    ]
+    if free:
+        return random.choice(free)
     return random_position(min_x, max_x, min_y, max_y)
 
 
+class CellPool:
+    """
+    A set of grid cells with O(1) add, remove and random choice.
+    
+    Cells can be any hashable id, e.g. (x, y) tuples or packed ints.
+    Useful for tracking free cells on a grid, e.g. where food may spawn.
+    """
+    
+    def __init__(self, cells: Iterable[Hashable] = ()):
+        self._cells: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+        for cell in cells:
+            self.add(cell)
+    
+    def add(self, cell: Hashable):
+        """Add a cell to the pool"""
+        if cell not in self._index:
+            self._index[cell] = len(self._cells)
+            self._cells.append(cell)
+    
+    def discard(self, cell: Hashable):
+        """Remove a cell from the pool if present"""
+        i = self._index.pop(cell, None)
+        if i is None:
+            return
+        # Move the last cell into the hole so removal stays O(1)
+        last = self._cells.pop()
+        if i < len(self._cells):
+            self._cells[i] = last
+            self._index[last] = i
+    
+    def choice(self) -> Hashable:
+        """Pick a random cell (raises IndexError if empty)"""
+        return random.choice(self._cells)
+    
+    def __contains__(self, cell) -> bool:
+        return cell in self._index
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._cells)
+    
+    def __len__(self) -> int:
+        return len(self._cells)
+
+
 def lerp(a: float, b: float, t: float) -> float:
     """Linear interpolation between a and b"""
     return a + (b - a) * t
@@ -69,6 +155,18 @@ def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
 
 
+def distance_sq(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Calculate squared distance between two points.
+    
+    Cheaper than distance() since it skips the square root; use it when
+    only comparing distances, e.g. distance_sq(...) <= radius * radius.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+
 def manhattan_distance(x1: int, y1: int, x2: int, y2: int) -> int:
     """Calculate Manhattan distance between two points"""
     return abs(x2 - x1) + abs(y2 - y1)
@@ -76,11 +174,8 @@ def manhattan_distance(x1: int, y1: int, x2: int, y2: int) -> int:
 
 def sign(value: float) -> int:
     """Get the sign of a value (-1, 0, or 1)"""
-    if value > 0:
-        return 1
-    elif value < 0:
-        return -1
-    return 0
+    # bool - bool is an int, so no branches are needed
+    return (value > 0) - (value < 0)
 
 
 def center_text(text: str, width: int) -> str:
@@ -96,17 +191,19 @@ def wrap_text(text: str, width: int) -> List[str]:
     words = text.split()
     lines = []
     current_line = []
-    current_length = 0
+    # Characters in current_line once joined, separating spaces included
+    line_length = 0
     
     for word in words:
-        if current_length + len(word) + len(current_line) <= width:
+        if current_line and line_length + 1 + len(word) <= width:
             current_line.append(word)
-            current_length += len(word)
+            line_length += 1 + len(word)
         else:
+            # Start a new line (words longer than width get a line of their own)
             if current_line:
                 lines.append(' '.join(current_line))
             current_line = [word]
-            current_length = len(word)
+            line_length = len(word)
     
     if current_line:
         lines.append(' '.join(current_line))
@@ -2,8 +2,16 @@
 Unit tests for PyTermGame engine.
 """
 
+import os
+import sys
+import time
+import weakref
+
 import pytest
+from pytermgame.engine import SimpleGame
 from pytermgame.entities import Entity, Sprite, EntityGroup
+from pytermgame.screen import Screen
+from pytermgame.input import ANSIKeyDecoder, Keys, InputHandler, decode_ansi_keys
 from pytermgame.collision import (
     check_collision, 
     point_in_rect, 
@@ -12,10 +20,14 @@ from pytermgame.collision import (
     clamp
 )
 from pytermgame.utils import (
+    CellPool,
     random_position,
+    random_position_excluding,
     center_text,
+    distance_sq,
     manhattan_distance,
-    sign
+    sign,
+    wrap_text
 )
 
 
@@ -57,6 +69,34 @@ class TestEntity:
         entity.stop()
         assert entity.vx == 0
         assert entity.vy == 0
+        
+    def test_entity_has_slots(self):
+        """Test entities and sprites carry no per-instance dict."""
+        entity = Entity()
+        sprite = Sprite.from_char('@')
+        assert not hasattr(entity, '__dict__')
+        assert not hasattr(sprite, '__dict__')
+        assert weakref.ref(entity)() is entity
+        assert weakref.ref(sprite)() is sprite
+        with pytest.raises(AttributeError):
+            entity.hp = 3
+        
+        class Enemy(Entity):
+            pass
+        
+        enemy = Enemy()
+        enemy.hp = 3
+        assert enemy.hp == 3
+        
+    def test_entity_bounds_follow_changes(self):
+        """Test bounds track direct position and sprite changes."""
+        entity = Entity(x=1.5, y=2)
+        assert entity.bounds == (1, 2, 1, 1)
+        entity.x = 4
+        entity.sprite = Sprite.from_string("##\n##\n##")
+        assert entity.bounds == (4, 2, 2, 3)
+        assert entity.contains_point(5, 4)
+        assert not entity.contains_point(6, 4)
 
 
 class TestSprite:
@@ -79,6 +119,38 @@ class TestSprite:
         sprite = Sprite.from_string(art)
         assert sprite.width == 3
         assert sprite.height == 3
+        
+    def test_sprite_lines_are_padded(self):
+        """Test ragged lines are padded to the sprite width."""
+        sprite = Sprite.from_string("#\n###\n##")
+        assert (sprite.width, sprite.height) == (3, 3)
+        assert sprite.lines == ["#  ", "###", "## "]
+        
+    def test_sprite_size_follows_new_lines(self):
+        """Test assigning new lines updates the sprite size."""
+        sprite = Sprite.from_char('@')
+        sprite.lines = ["abc", "d"]
+        assert (sprite.width, sprite.height) == (3, 2)
+        assert sprite.lines == ["abc", "d  "]
+        
+    def test_entity_draws_reassigned_lines(self):
+        """Test an entity draws the sprite's current lines."""
+        screen = Screen(4, 1)
+        sprite = Sprite.from_string("ab")
+        entity = Entity(sprite=sprite)
+        sprite.lines = ["w yz"]
+        assert sprite.runs == [(0, 0, "w"), (0, 2, "yz")]
+        entity.draw(screen)
+        assert screen._chars == ['w', ' ', 'y', 'z']
+    
+    def test_sprite_draw_skips_spaces(self):
+        """Test spaces in a sprite leave the screen untouched."""
+        screen = Screen(5, 2)
+        screen.fill_rect(0, 0, 5, 2, '.')
+        entity = Entity(x=-1, y=0, sprite=Sprite.from_string("ab cd\n e", color=3))
+        entity.draw(screen)
+        assert ''.join(screen._chars) == "b.cd.e...."
+        assert list(screen._colors[:5]) == [3, 0, 3, 3, 0]
 
 
 class TestEntityGroup:
@@ -97,6 +169,44 @@ class TestEntityGroup:
         group.remove(e1)
         assert len(group) == 1
         
+    def test_remove_uses_identity(self):
+        """Test removing an entity leaves equal-valued entities alone."""
+        group = EntityGroup()
+        first = group.add(Entity(x=1, y=1))
+        twin = group.add(Entity(x=1, y=1))
+        last = group.add(Entity(x=2, y=2))
+        
+        group.remove(twin)
+        group.remove(twin)
+        assert [id(e) for e in group] == [id(first), id(last)]
+        
+        first.active = False
+        group.remove_inactive()
+        assert list(group) == [last]
+        
+    def test_entities_snapshot(self):
+        """Test entities is indexable and mutating it fails loudly."""
+        group = EntityGroup()
+        entity = group.add(Entity())
+        assert group.entities[0] is entity
+        with pytest.raises(AttributeError):
+            group.entities.append(Entity())
+        assert len(group) == 1
+        
+        group.entities = [Entity(), entity]
+        assert len(group) == 2
+        assert group.entities[1] is entity
+        
+    def test_remove_while_iterating(self):
+        """Test entities can be removed while looping over the group."""
+        group = EntityGroup()
+        for x in range(5):
+            group.add(Entity(x=x))
+        for e in group:
+            if e.x % 2:
+                group.remove(e)
+        assert [e.x for e in group] == [0, 2, 4]
+        
     def test_get_by_tag(self):
         """Test filtering by tag."""
         group = EntityGroup()
@@ -106,6 +216,61 @@ class TestEntityGroup:
         
         enemies = group.get_by_tag("enemy")
         assert len(enemies) == 2
+        
+    def test_within_radius(self):
+        """Test radius queries include the boundary and skip inactive."""
+        group = EntityGroup()
+        near = group.add(Entity(x=3, y=4))
+        group.add(Entity(x=4, y=4))
+        group.add(Entity(x=1, y=1, active=False))
+        assert group.within_radius(0, 0, 5) == [near]
+        
+    def test_draw_keeps_entity_order(self):
+        """Test batched point entities still draw in insertion order."""
+        screen = Screen(4, 1)
+        group = EntityGroup()
+        group.add(Entity(x=0, y=0))
+        group.add(Entity(x=0, y=0, sprite=Sprite.from_string("ab")))
+        group.add(Entity(x=1, y=0))
+        group.add(Entity(x=9, y=0))
+        group.add(Entity(x=3, y=0, active=False))
+        group.draw(screen)
+        assert screen._chars == ['a', '█', ' ', ' ']
+    
+    def test_update_moves_active_entities(self):
+        """Test group update steps entities and honours overrides."""
+        class Falling(Entity):
+            def update(self, dt: float = 1.0):
+                self.y += 2 * dt
+        
+        group = EntityGroup()
+        mover = group.add(Entity(x=0, y=0, vx=1, vy=-1))
+        idle = group.add(Entity(x=0, y=0, vx=1, active=False))
+        faller = group.add(Falling(x=0, y=0, vx=5))
+        group.update(0.5)
+        assert (mover.x, mover.y) == (1, -1)
+        assert idle.x == 0
+        assert (faller.x, faller.y) == (0, 1)
+    
+    def test_collide_all_matches_pairwise(self):
+        """Test the sweep finds exactly the pairwise collisions."""
+        group = EntityGroup()
+        wide = Sprite.from_string("####\n####")
+        for i in range(30):
+            group.add(Entity(x=(i * 7) % 23, y=(i * 5) % 11, vx=i,
+                             sprite=wide if i % 3 else None))
+        group.entities[4].active = False
+        
+        active = [e for e in group if e.active]
+        expected = {
+            (id(a), id(b))
+            for i, a in enumerate(active) for b in active[i + 1:]
+            if a.collides_with(b)
+        }
+        found = group.collide_all()
+        assert len(found) == len(expected)
+        assert {frozenset((id(a), id(b))) for a, b in found} == \
+            {frozenset(pair) for pair in expected}
 
 
 class TestCollision:
@@ -176,6 +341,298 @@ class TestUtils:
         assert sign(10) == 1
         assert sign(-10) == -1
         assert sign(0) == 0
+        assert sign(-0.5) == -1
+        assert type(sign(2.5)) is int
+        
+    def test_distance_sq(self):
+        """Test squared distance."""
+        assert distance_sq(0, 0, 3, 4) == 25
+        assert distance_sq(1, 1, 1, 1) == 0
+        
+    def test_wrap_text(self):
+        """Test wrapping counts the spaces between words."""
+        assert wrap_text("aa bb cc", 5) == ["aa bb", "cc"]
+        assert wrap_text("aa bb cc", 4) == ["aa", "bb", "cc"]
+        assert wrap_text("a verylongword b", 5) == ["a", "verylongword", "b"]
+        assert wrap_text("", 10) == []
+        
+    def test_random_position_excluding_dense(self):
+        """Test a free cell is found even when guessing keeps failing."""
+        exclude = [(x, y) for x in range(10) for y in range(10) if (x, y) != (7, 3)]
+        assert random_position_excluding(0, 10, 0, 10, exclude, max_attempts=0) == (7, 3)
+        assert random_position_excluding(0, 10, 0, 10, exclude) == (7, 3)
+        
+    def test_cell_pool(self):
+        """Test CellPool add/discard/choice."""
+        pool = CellPool([(0, 0), (1, 0), (2, 0)])
+        pool.add((1, 0))
+        assert len(pool) == 3
+        
+        pool.discard((0, 0))
+        pool.discard((5, 5))
+        assert (0, 0) not in pool
+        assert sorted(pool) == [(1, 0), (2, 0)]
+        for _ in range(20):
+            assert pool.choice() in ((1, 0), (2, 0))
+
+
+class TestInput:
+    """Tests for input decoding."""
+    
+    def test_decode_plain_keys(self):
+        """Test that ordinary bytes map to their key codes."""
+        assert decode_ansi_keys(b'wq ') == [ord('w'), Keys.Q, Keys.SPACE]
+        
+    def test_decode_arrow_sequences(self):
+        """Test that several queued arrow keys are all decoded."""
+        data = b'\x1b[A\x1b[D\x1bOC '
+        assert decode_ansi_keys(data) == [Keys.UP, Keys.LEFT, Keys.RIGHT, Keys.SPACE]
+        
+    def test_wasd_mapping(self):
+        """Test WASD keys translate to arrows only when enabled."""
+        handler = InputHandler()
+        assert handler.process_key(ord('W')) == Keys.UP
+        assert handler.process_key(ord('d')) == Keys.RIGHT
+        assert handler.process_key(ord('q')) == Keys.Q
+        assert handler.process_key(Keys.LEFT) == Keys.LEFT
+        assert handler.process_key(1000) == 1000
+        assert handler.is_direction_key(Keys.DOWN)
+        assert not handler.is_direction_key(ord('s'))
+        assert InputHandler(use_wasd=False).process_key(ord('a')) == ord('a')
+        
+    def test_decode_lone_escape(self):
+        """Test that a bare ESC is kept as the escape key."""
+        assert decode_ansi_keys(b'\x1b') == [Keys.ESCAPE]
+        
+    def test_decode_drops_unknown_sequences(self):
+        """Test unrecognised escape sequences are not read as ESC."""
+        data = b'a\x1b[H\x1b[3~\x1bOP\x1b[1;5Ab'
+        assert decode_ansi_keys(data) == [ord('a'), ord('b')]
+        
+    def test_decoder_joins_split_sequence(self):
+        """Test an arrow split across two reads decodes once complete."""
+        decoder = ANSIKeyDecoder()
+        assert decoder.feed(b'q\x1b[') == [Keys.Q]
+        assert decoder.feed(b'A') == [Keys.UP]
+        assert decoder.feed(b'\x1b[1;') == []
+        assert decoder.feed(b'5Dx') == [ord('x')]
+        
+    def test_decoder_holds_trailing_escape(self):
+        """Test a read ending in ESC waits to see if a sequence follows."""
+        decoder = ANSIKeyDecoder()
+        assert decoder.feed(b'\x1b') == []
+        assert decoder.feed(b'[A') == [Keys.UP]
+        assert decoder.feed(b'\x1b') == []
+        assert decoder.feed(b'') == [Keys.ESCAPE]
+        assert decoder.feed(b'\x1b') == []
+        assert decoder.feed(b'q') == [Keys.ESCAPE, Keys.Q]
+
+
+class TestGame:
+    """Tests for the game loop helpers."""
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="select() needs a POSIX pipe")
+    def test_wait_wakes_on_input(self):
+        """Test keys arriving during the frame wait are handled early."""
+        game = SimpleGame(width=10, height=5)
+        received = []
+        game.on_input = received.extend
+        read_fd, write_fd = os.pipe()
+        try:
+            game._stdin_fd = read_fd
+            selector = game._input_selector()
+            os.write(write_fd, b'\x1b[Aq')
+            game._wait_for_frame(time.monotonic_ns() + 50_000_000, selector)
+            selector.close()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        assert received == [Keys.UP, Keys.Q]
+        
+        game._set_keys([])
+        assert game.get_keys() == [Keys.UP, Keys.Q]
+        assert game.is_key_pressed(Keys.Q)
+
+
+class TestScreen:
+    """Tests for Screen rendering."""
+    
+    def test_first_refresh_draws_everything(self, capfd):
+        """Test that the first refresh paints every cell."""
+        screen = Screen(4, 2)
+        screen.draw_text(0, 0, "ab")
+        screen.refresh()
+        out = capfd.readouterr().out
+        assert "ab" in out
+        assert "\033[2;1H" in out
+        
+    def test_refresh_skips_unchanged_frame(self, capfd):
+        """Test that redrawing the same frame writes nothing."""
+        screen = Screen(4, 2)
+        screen.draw_char(1, 1, '@')
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.clear()
+        screen.draw_char(1, 1, '@')
+        screen.refresh()
+        assert capfd.readouterr().out == ""
+        
+    def test_refresh_writes_only_changed_cells(self, capfd):
+        """Test that only the changed cell is emitted."""
+        screen = Screen(4, 2)
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.draw_char(2, 1, '@')
+        screen.refresh()
+        out = capfd.readouterr().out
+        assert out == "\033[2;3H\033[0m@"
+        
+    def test_refresh_skips_repeated_moves_and_colors(self, capfd):
+        """Test cursor moves and colors are only sent when they change."""
+        screen = Screen(6, 2)
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.draw_text(0, 0, "ab", 1)
+        screen.draw_text(4, 0, "cd", 1)
+        screen.draw_text(0, 1, "e", 1)
+        screen.refresh()
+        out = capfd.readouterr().out
+        # One color code, a move per run, one reset at the end
+        assert out == "\033[1;1H\033[91mab\033[1;5Hcd\033[2;1He\033[0m"
+        
+    def test_refresh_repaints_short_gaps(self, capfd):
+        """Test a short same-colored gap is rewritten instead of skipped."""
+        screen = Screen(12, 1)
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.draw_char(0, 0, 'a')
+        screen.draw_char(3, 0, 'b')
+        screen.draw_char(11, 0, 'c')
+        screen.refresh()
+        out = capfd.readouterr().out
+        assert out == "\033[1;1H\033[0ma  b\033[1;12Hc"
+        
+    def test_refresh_jumps_over_wide_gaps(self, capfd):
+        """Test a gap of multi-byte glyphs is skipped when a move is shorter."""
+        screen = Screen(8, 1)
+        screen.draw_text(1, 0, "████")
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.draw_char(0, 0, 'a')
+        screen.draw_char(5, 0, 'b')
+        screen.refresh()
+        out = capfd.readouterr().out
+        assert out == "\033[1;1H\033[0ma\033[1;6Hb"
+        
+    def test_refresh_emits_color_segments(self, capfd):
+        """Test a run is written as one string per color segment."""
+        screen = Screen(6, 1)
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.draw_text(0, 0, "abc", 1)
+        screen.draw_text(3, 0, "de", 2)
+        screen.draw_char(5, 0, 'f', 1)
+        screen.refresh()
+        out = capfd.readouterr().out
+        assert out == "\033[1;1H\033[91mabc\033[92mde\033[91mf\033[0m"
+        
+    def test_refresh_with_clear(self, capfd):
+        """Test refresh(clear=True) blanks the buffer for the next frame."""
+        screen = Screen(3, 1)
+        screen.draw_text(0, 0, "abc")
+        screen.refresh(clear=True)
+        assert screen._chars == [' ', ' ', ' ']
+        capfd.readouterr()
+        
+        screen.draw_text(0, 0, "abc")
+        screen.refresh(clear=True)
+        assert capfd.readouterr().out == ""
+        
+    def test_invalidate_forces_full_redraw(self, capfd):
+        """Test that invalidate repaints unchanged cells."""
+        screen = Screen(3, 1)
+        screen.draw_text(0, 0, "xyz")
+        screen.refresh()
+        capfd.readouterr()
+        
+        screen.invalidate()
+        screen.refresh()
+        assert "xyz" in capfd.readouterr().out
+        
+    def test_lines_are_clipped(self):
+        """Test horizontal and vertical lines clip to the screen."""
+        screen = Screen(4, 3)
+        screen.draw_hline(-1, 0, 10, '-', 2)
+        screen.draw_vline(3, -2, 4, '|', 3)
+        screen.draw_vline(9, 0, 3, '|')
+        assert screen._chars == [
+            '-', '-', '-', '|',
+            ' ', ' ', ' ', '|',
+            ' ', ' ', ' ', ' ',
+        ]
+        assert list(screen._colors[:4]) == [2, 2, 2, 3]
+    
+    def test_text_and_rect_are_clipped(self):
+        """Test text and filled rectangles clip to the screen."""
+        screen = Screen(4, 3)
+        screen.draw_text(-2, 0, "abcdef", 1)
+        screen.fill_rect(2, 1, 5, 5, '#', 4)
+        screen.draw_text(0, 5, "hidden")
+        assert screen._chars == [
+            'c', 'd', 'e', 'f',
+            ' ', ' ', '#', '#',
+            ' ', ' ', '#', '#',
+        ]
+        assert list(screen._colors) == [1, 1, 1, 1, 0, 0, 4, 4, 0, 0, 4, 4]
+    
+    def test_out_of_range_colors_use_default(self):
+        """Test colors that do not fit a byte draw as the default color."""
+        screen = Screen(4, 2)
+        screen.draw_char(0, 0, 'x', -1)
+        screen.draw_text(1, 0, "ab", 300)
+        screen.fill_rect(0, 1, 2, 1, '#', -5)
+        screen.draw_points([(3, 1)], '*', 1000)
+        assert list(screen._colors) == [0] * 8
+        assert ''.join(screen._chars) == "xab ## *"
+        
+    def test_draw_box(self):
+        """Test box edges, corners, title and clipping."""
+        screen = Screen(7, 4)
+        screen.draw_box(0, 0, 7, 3, "T", 5)
+        screen.draw_box(5, 2, 4, 4)
+        assert ''.join(screen._chars) == (
+            "+- T -+"
+            "|     |"
+            "+----+-"
+            "     | "
+        )
+        assert screen._colors[0] == screen._colors[7] == 5
+        
+    def test_async_output(self, capfd):
+        """Test frames written by the background writer arrive in order."""
+        screen = Screen(3, 1, async_output=True)
+        for text in ("abc", "abd", "xbd"):
+            screen.draw_text(0, 0, text)
+            screen.refresh()
+        screen.close()
+        assert capfd.readouterr().out == (
+            "\033[1;1H\033[0mabc" "\033[1;3H\033[0md" "\033[1;1H\033[0mx"
+        )
+        
+    def test_write_is_sent_with_next_refresh(self, capfd):
+        """Test that queued output waits for the frame flush."""
+        screen = Screen(2, 1)
+        screen.write("\033[2J")
+        assert capfd.readouterr().out == ""
+        
+        screen.refresh()
+        assert capfd.readouterr().out.startswith("\033[2J\033[1;1H")
 
 
 if __name__ == "__main__":
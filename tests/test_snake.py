@@ -0,0 +1,151 @@
+"""
+Unit tests for the Snake game logic.
+"""
+
+import pytest
+from pytermgame.games.snake.main import (
+    SnakeGame,
+    PLAY_AREA_X,
+    PLAY_AREA_Y,
+    PLAY_WIDTH,
+    PLAY_HEIGHT,
+    UP,
+    RIGHT,
+    DIRECTION_STEPS,
+    pack_cell,
+    unpack_cell,
+)
+
+
+def step(game, *keys):
+    """Run one frame with the given keys pressed."""
+    game.step(keys)
+
+
+def test_cell_packing():
+    """Test packed cells round-trip and step like coordinates."""
+    cell = pack_cell(12, 7)
+    assert unpack_cell(cell) == (12, 7)
+    assert unpack_cell(cell + DIRECTION_STEPS[UP]) == (12, 6)
+    assert unpack_cell(cell + DIRECTION_STEPS[RIGHT]) == (13, 7)
+
+
+class TestSnake:
+    """Tests for SnakeGame movement and collisions."""
+    
+    def setup_method(self):
+        self.game = SnakeGame()
+        self.game.setup()
+    
+    def test_snake_moves_forward(self):
+        """Test that the snake advances one cell per tick."""
+        head_x, head_y = unpack_cell(self.game.snake[0])
+        self.game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        step(self.game)
+        assert unpack_cell(self.game.snake[0]) == (head_x + 1, head_y)
+        assert len(self.game.snake) == 3
+        assert self.game._snake_set == set(self.game.snake)
+    
+    def test_snake_grows_on_food(self):
+        """Test eating food grows the snake and scores."""
+        head_x, head_y = unpack_cell(self.game.snake[0])
+        self.game.food = pack_cell(head_x + 1, head_y)
+        step(self.game)
+        assert len(self.game.snake) == 4
+        assert self.game.score == 10
+        assert self.game.food not in self.game._snake_set
+    
+    def test_free_cells_track_snake(self):
+        """Test that free cells stay the complement of the body."""
+        self.game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        for _ in range(5):
+            step(self.game)
+        free = set(self.game._free)
+        assert not free & self.game._snake_set
+        assert len(free) + len(self.game.snake) == PLAY_WIDTH * PLAY_HEIGHT
+    
+    def test_wall_collision(self):
+        """Test running into the wall ends the game."""
+        head_x, head_y = unpack_cell(self.game.snake[0])
+        self.game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        for _ in range(PLAY_AREA_X + PLAY_WIDTH - head_x):
+            step(self.game)
+        assert self.game.game_over is True
+    
+    def test_self_collision(self):
+        """Test running into the body ends the game."""
+        game = self.game
+        game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        # Head at (10, 10) heading up, with the body curling to its right
+        game.snake.clear()
+        game.snake.extend(
+            pack_cell(x, y) for x, y in [(10, 10), (11, 10), (11, 11), (10, 11), (9, 11)]
+        )
+        game._snake_set = set(game.snake)
+        game.direction = game.next_direction = UP
+        step(game, ord('d'))
+        assert game.game_over is True
+    
+    def test_incremental_draw_matches_full_redraw(self):
+        """Test that drawing only changed cells gives the same frame."""
+        game = self.game
+        head_x, head_y = unpack_cell(game.snake[0])
+        game.food = pack_cell(head_x + 2, head_y)
+        game.draw()
+        for keys in [(), (), (ord('w'),), (), (), (ord('a'),), ()]:
+            step(game, *keys)
+            game.draw()
+        incremental = (list(game.screen._chars), list(game.screen._colors))
+        
+        game._force_redraw = True
+        game.draw()
+        assert (game.screen._chars, list(game.screen._colors)) == incremental
+    
+    def test_headless_rollout(self):
+        """Test that a game can be played without a terminal."""
+        game = self.game
+        frames = 0
+        while not game.game_over and frames < 1000:
+            game.step()
+            frames += 1
+        assert game.game_over is True
+        assert game.frame_count == frames
+    
+    def test_pause_and_resume(self):
+        """Test that P pauses movement and resumes it."""
+        game = self.game
+        game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        head = game.snake[0]
+        step(game, ord('p'))
+        step(game)
+        assert game.paused is True
+        assert game.snake[0] == head
+        
+        step(game, ord('p'))
+        step(game)
+        assert game.paused is False
+        assert game.snake[0] != head
+    
+    def test_vertical_skip_with_equal_direction_tuple(self):
+        """Test the vertical frame skip works for any equal direction tuple."""
+        game = self.game
+        game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        game.direction = game.next_direction = (0, -1)
+        head = game.snake[0]
+        moves = 0
+        for _ in range(4):
+            step(game)
+            moves += game.snake[0] != head
+            head = game.snake[0]
+        assert moves == 2
+    
+    def test_no_reverse_turn(self):
+        """Test that a 180-degree turn is ignored."""
+        self.game.food = pack_cell(PLAY_AREA_X, PLAY_AREA_Y)
+        step(self.game, ord('a'))
+        assert self.game.direction == RIGHT
+        assert self.game.game_over is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])